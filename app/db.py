@@ -6,15 +6,50 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from sqlmodel import SQLModel, Session, create_engine
+
+import streamlit as st
+from sqlmodel import SQLModel, Session, create_engine, text
+from sqlalchemy import event, table, column
+from sqlalchemy.schema import CreateIndex
 
 # URL подключения к базе данных SQLite
 # SQLite - это легкая файловая база данных, которая хранится в одном файле
 DATABASE_URL = "sqlite:///./diary.db"
 
-# Создаем движок базы данных
-# echo=False означает, что SQL-запросы не будут выводиться в консоль (для отладки можно поставить True)
-engine = create_engine(DATABASE_URL, echo=False)
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Настраивает каждое новое соединение с SQLite
+    
+    - journal_mode=WAL: чтение не блокируется записью, коммит не перезаписывает весь журнал
+    - synchronous=NORMAL: в режиме WAL безопасно и не требует fsync на каждый коммит
+    - cache_size=-65536: кэш страниц 64 МБ (отрицательное значение - в килобайтах)
+    - temp_store=MEMORY: временные таблицы и сортировки в памяти
+    - mmap_size=268435456: чтение файла базы через отображение в память (256 МБ)
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+@st.cache_resource
+def get_engine():
+    """
+    Движок базы данных, общий для всех сессий и перезапусков скрипта
+    
+    st.cache_resource создает движок (и его пул соединений) один раз на процесс
+    Streamlit, в том числе после перезагрузки модулей при изменении кода.
+    """
+    # echo=False означает, что SQL-запросы не будут выводиться в консоль (для отладки можно поставить True)
+    # check_same_thread=False: Streamlit выполняет скрипт в разных потоках,
+    # а пул соединений SQLAlchemy переиспользует соединения между перезапусками
+    engine = create_engine(DATABASE_URL, echo=False, connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    return engine
 
 
 def init_db() -> None:
@@ -27,7 +62,22 @@ def init_db() -> None:
     
     # Создаем все таблицы в базе данных
     # Если таблицы уже существуют, ничего не произойдет
+    engine = get_engine()
     SQLModel.metadata.create_all(engine)
+    
+    # create_all не добавляет новые индексы в уже существующие таблицы,
+    # поэтому недостающие индексы создаем отдельно через CREATE INDEX IF NOT EXISTS
+    # (проверка checkfirst не видит индексы по выражениям и пыталась бы создать их снова)
+    with engine.begin() as conn:
+        for db_table in SQLModel.metadata.sorted_tables:
+            for index in db_table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+        
+        # Отдельный индекс по type покрыт составным ix_notif_type_unread
+        # и только замедляет запись - удаляем его из существующих баз
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_notification_type")
+    
+    init_search_index()
 
 
 @contextmanager
@@ -46,5 +96,99 @@ def get_session() -> Session:
         session.add(object)
         session.commit()
     """
-    with Session(engine) as session:
-        yield session
\ No newline at end of file
+    with Session(get_engine()) as session:
+        yield session
+
+
+def get_request_session() -> Session:
+    """
+    Сессия базы данных, общая для всего текущего запуска скрипта Streamlit
+    
+    Streamlit перезапускает скрипт при каждом действии пользователя. Вместо того
+    чтобы открывать новую сессию в каждом блоке, все блоки страницы используют
+    одну сессию, которая хранится в st.session_state.
+    
+    В конце запуска сессию нужно освободить через close_request_session().
+    """
+    session = st.session_state.get("_db")
+    if session is None:
+        session = Session(get_engine())
+        st.session_state["_db"] = session
+    return session
+
+
+def close_request_session() -> None:
+    """
+    Освобождает сессию текущего запуска
+    
+    Соединение возвращается в пул, загруженные объекты забываются; сам объект
+    сессии остается в st.session_state и переиспользуется в следующем запуске.
+    """
+    session = st.session_state.get("_db")
+    if session is not None:
+        session.close()
+
+
+# =============================================================================
+# ПОЛНОТЕКСТОВЫЙ ПОИСК (SQLite FTS5)
+# =============================================================================
+# Поиск через LIKE '%...%' не может использовать индексы и сканирует таблицы целиком.
+# Вместо этого все названия хранятся в виртуальной таблице FTS5 search_idx,
+# которую триггеры поддерживают в актуальном состоянии.
+
+# Описание таблицы для построения запросов в SQLAlchemy
+search_idx = table("search_idx", column("kind"), column("ref_id"), column("title"), column("extra"))
+
+# Какие поля каждой таблицы попадают в индекс: (раздел, таблица, поле title, поле extra)
+SEARCH_SOURCES = [
+    ("task", "task", "title", None),
+    ("show", "show", "title", None),
+    ("book", "book", "title", "author"),
+    ("learning", "learninglog", "topic", "notes"),
+]
+
+
+def init_search_index() -> None:
+    """
+    Создает индекс полнотекстового поиска и триггеры для его обновления
+    
+    Если индекс создается впервые, он заполняется уже существующими записями.
+    """
+    with get_engine().begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_idx'")
+        ).first()
+        if exists:
+            return
+        
+        # kind и ref_id не индексируются: по ним только отбираются результаты
+        conn.exec_driver_sql(
+            "CREATE VIRTUAL TABLE search_idx USING fts5("
+            "kind UNINDEXED, ref_id UNINDEXED, title, extra, "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        
+        for kind, source, title, extra in SEARCH_SOURCES:
+            columns = f"{title}, {extra}" if extra else title
+            values = f"'{kind}', new.id, new.{title}, " + (f"new.{extra}" if extra else "NULL")
+            insert_new = f"INSERT INTO search_idx (kind, ref_id, title, extra) VALUES ({values});"
+            delete_old = f"DELETE FROM search_idx WHERE kind = '{kind}' AND ref_id = old.id;"
+            
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER search_idx_{source}_ai AFTER INSERT ON {source} "
+                f"BEGIN {insert_new} END"
+            )
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER search_idx_{source}_au AFTER UPDATE OF {columns} ON {source} "
+                f"BEGIN {delete_old} {insert_new} END"
+            )
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER search_idx_{source}_ad AFTER DELETE ON {source} "
+                f"BEGIN {delete_old} END"
+            )
+            
+            # Заполняем индекс записями, созданными до появления поиска
+            conn.exec_driver_sql(
+                f"INSERT INTO search_idx (kind, ref_id, title, extra) "
+                f"SELECT '{kind}', id, {title}, {extra or 'NULL'} FROM {source}"
+            )
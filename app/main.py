@@ -12,25 +12,60 @@ Streamlit - это фреймворк для создания веб-прило
 """
 
 # Настройка путей для импорта модулей
+# Streamlit выполняет этот файл заново при каждом действии, поэтому путь
+# добавляется только один раз, а не дописывается в sys.path при каждом запуске
 import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 # Импорты основных библиотек
 import streamlit as st  # Веб-фреймворк
 from datetime import date, datetime, timedelta  # Работа с датами
 import calendar  # Работа с календарем
+import html  # Экранирование текста в HTML-разметке
+import pandas as pd  # Таблицы и графики аналитики
+from collections import defaultdict  # Словари-корзины по ключу
+from functools import wraps  # Обертки для функций вкладок
+from itertools import groupby  # Группировка отсортированных данных
 
 # Импорты наших модулей
-from app.db import init_db, get_session  # Работа с базой данных
+from app.db import init_db, get_session, get_request_session, close_request_session, search_idx  # Работа с базой данных
 from app.models import Task, Show, Book, LearningLog, Notification  # Модели данных
-from sqlmodel import select  # SQL-запросы
-
-# Инициализация базы данных при запуске приложения
-init_db()
+from sqlmodel import select, insert, update, delete, func, distinct, bindparam  # SQL-запросы
+from sqlmodel import union_all, literal, literal_column, null, cast, Integer, String  # Составные запросы (поиск)
 
 # Настройка страницы Streamlit
 st.set_page_config(page_title="Мой дневник", page_icon="📔", layout="wide")
 
+# Общие стили: подключаются один раз, а HTML-разметка ссылается на классы
+APP_STYLES = """
+<style>
+.cal { width: 100%; table-layout: fixed; border-collapse: separate; border-spacing: 4px; }
+.cal th { background-color: #f8f9fa; padding: 8px; text-align: center; font-weight: bold; border-radius: 5px; }
+.cal td { height: 80px; padding: 8px; border-radius: 8px; vertical-align: top; }
+.cal td.day { border: 1px solid #dee2e6; background-color: #ffffff; }
+.cal td.today { border: 2px solid #007bff; }
+.cal td.weekend { background-color: #fff3cd; }
+.cal .num { color: #495057; font-weight: bold; text-align: center; margin-bottom: 5px; }
+.cal .today .num { color: #dc3545; font-size: 16px; }
+.cal .weekend .num { color: #6c757d; font-size: inherit; }
+.cal .chip { color: white; padding: 3px; margin: 1px; border-radius: 4px; font-size: 9px; text-align: center; }
+.cal .chip-high { background-color: #dc3545; }
+.cal .chip-medium { background-color: #ffc107; }
+.cal .chip-low { background-color: #28a745; }
+.cal .chip-learning { background-color: #6f42c1; }
+</style>
+"""
+st.markdown(APP_STYLES, unsafe_allow_html=True)
+
+# Пропорции колонок для строк списков: один общий объект на все строки
+NOTIFICATION_ROW_COLUMNS = (4, 1)  # Уведомление | кнопка "прочитано"
+NOTIFICATION_ACTION_COLUMNS = (1, 1, 8)  # Кнопки действий на вкладке уведомлений
+SHOW_ROW_COLUMNS = (3, 1, 1, 1)  # Сериал | серия | сезон | удалить
+BOOK_ROW_COLUMNS = (3, 2, 1, 1)  # Книга | страницы | прогресс | удалить
+LEARNING_ROW_COLUMNS = (3, 2, 1)  # Тема | время | удалить
+
 # Инициализация базы данных
 # Все данные теперь хранятся в SQLite базе данных
 
@@ -39,7 +74,7 @@ st.set_page_config(page_title="Мой дневник", page_icon="📔", layout=
 # =============================================================================
 # Эти функции автоматически создают уведомления на основе ваших данных
 
-def check_deadline_reminders():
+def check_deadline_reminders(session):
     """
     Проверяет приближающиеся дедлайны и создает уведомления
     
@@ -47,51 +82,55 @@ def check_deadline_reminders():
     1. Находит задачи с дедлайнами в ближайшие 3 дня
     2. Создает уведомления в зависимости от количества дней до дедлайна
     3. Проверяет, не создано ли уже уведомление для этой задачи сегодня
+    
+    Args:
+        session: открытая сессия БД; коммит выполняет вызывающий код
     """
     today = date.today()
-    with get_session() as session:
-        # Задачи с дедлайнами в ближайшие 3 дня
-        upcoming_tasks = session.exec(
-            select(Task).where(
-                Task.due.isnot(None),
-                Task.due >= today,
-                Task.due <= today + timedelta(days=3),
-                Task.done == False
-            )
-        ).all()
+    # Задачи с дедлайнами в ближайшие 3 дня.
+    # Полуоткрытый диапазон [сегодня, сегодня + 4) по индексу (done, due):
+    # проверка на NULL не нужна, пустой дедлайн в диапазон не попадает
+    upcoming_tasks = session.exec(
+        select(Task).where(
+            Task.done == False,
+            Task.due >= today,
+            Task.due < today + timedelta(days=4)
+        )
+    ).all()
+    
+    # Одним запросом узнаем, по каким задачам уже есть уведомление за сегодня
+    task_ids = [task.id for task in upcoming_tasks]
+    notified_ids = set(session.exec(
+        select(Notification.related_id).where(
+            Notification.type == "deadline",
+            Notification.created_date == today,
+            Notification.related_id.in_(task_ids)
+        )
+    ).all()) if task_ids else set()
+    
+    pending = []
+    for task in upcoming_tasks:
+        if task.id in notified_ids:
+            continue
         
-        for task in upcoming_tasks:
-            days_left = (task.due - today).days
-            if days_left == 0:
-                message = f"⏰ Сегодня дедлайн задачи: {task.title}"
-                notification_type = "deadline"
-            elif days_left == 1:
-                message = f"⚠️ Завтра дедлайн задачи: {task.title}"
-                notification_type = "deadline"
-            else:
-                message = f"📅 Через {days_left} дней дедлайн задачи: {task.title}"
-                notification_type = "deadline"
-            
-            # Проверяем, не создано ли уже уведомление
-            existing = session.exec(
-                select(Notification).where(
-                    Notification.type == notification_type,
-                    Notification.related_id == task.id,
-                    Notification.created_date == today
-                )
-            ).first()
-            
-            if not existing:
-                notification = Notification(
-                    type=notification_type,
-                    title="Напоминание о дедлайне",
-                    message=message,
-                    related_id=task.id
-                )
-                session.add(notification)
-                session.commit()
+        days_left = (task.due - today).days
+        if days_left == 0:
+            message = f"⏰ Сегодня дедлайн задачи: {task.title}"
+        elif days_left == 1:
+            message = f"⚠️ Завтра дедлайн задачи: {task.title}"
+        else:
+            message = f"📅 Через {days_left} дней дедлайн задачи: {task.title}"
+        
+        pending.append(Notification(
+            type="deadline",
+            title="Напоминание о дедлайне",
+            message=message,
+            related_id=task.id
+        ))
+    
+    session.add_all(pending)
 
-def check_achievements():
+def check_achievements(session):
     """
     Проверяет достижения и создает мотивационные сообщения
     
@@ -99,151 +138,254 @@ def check_achievements():
     1. Выполнение множественных задач в день (3+ задач)
     2. Завершение книг (прочитано 100% страниц)
     3. Интенсивное обучение (60+ минут в день)
+    
+    Args:
+        session: открытая сессия БД; коммит выполняет вызывающий код
     """
     today = date.today()
-    with get_session() as session:
-        # Проверяем выполненные задачи за сегодня
-        today_tasks = session.exec(
-            select(Task).where(
-                Task.done == True,
-                Task.due == today
-            )
-        ).all()
-        
-        if len(today_tasks) >= 3:
-            message = f"🎉 Отлично! Вы выполнили {len(today_tasks)} задач сегодня!"
-            notification_type = "achievement"
-            
-            # Проверяем, не создано ли уже уведомление
-            existing = session.exec(
-                select(Notification).where(
-                    Notification.type == notification_type,
-                    Notification.title == "Множественные задачи выполнены",
-                    Notification.created_date == today
-                )
-            ).first()
-            
-            if not existing:
-                notification = Notification(
-                    type=notification_type,
-                    title="Множественные задачи выполнены",
-                    message=message
-                )
-                session.add(notification)
-                session.commit()
+    # Новые уведомления копятся в списке и добавляются в сессию один раз в конце,
+    # чтобы промежуточные проверки не вызывали лишних flush
+    pending = []
+    
+    # Проверяем выполненные задачи за сегодня (считаем прямо в SQL)
+    done_today = session.exec(
+        select(func.count()).select_from(Task).where(
+            Task.done == True,
+            Task.due == today
+        )
+    ).one()
+    
+    if done_today >= 3:
+        message = f"🎉 Отлично! Вы выполнили {done_today} задач сегодня!"
+        notification_type = "achievement"
         
-        # Проверяем завершенные книги
-        completed_books = session.exec(
-            select(Book).where(
-                Book.pages_read >= Book.pages_total,
-                Book.pages_total > 0
+        # Проверяем, не создано ли уже уведомление
+        existing = session.exec(
+            select(Notification).where(
+                Notification.type == notification_type,
+                Notification.title == "Множественные задачи выполнены",
+                Notification.created_date == today
             )
-        ).all()
+        ).first()
         
-        for book in completed_books:
-            message = f"📚 Поздравляем! Вы завершили книгу '{book.title}'!"
-            notification_type = "achievement"
-            
-            # Проверяем, не создано ли уже уведомление
-            existing = session.exec(
-                select(Notification).where(
-                    Notification.type == notification_type,
-                    Notification.related_id == book.id
-                )
-            ).first()
-            
-            if not existing:
-                notification = Notification(
-                    type=notification_type,
-                    title="Книга завершена",
-                    message=message,
-                    related_id=book.id
-                )
-                session.add(notification)
-                session.commit()
+        if not existing:
+            pending.append(Notification(
+                type=notification_type,
+                title="Множественные задачи выполнены",
+                message=message
+            ))
+    
+    # Проверяем завершенные книги, о которых еще не было уведомления.
+    # Выбираем только id и название - полные объекты Book здесь не нужны
+    notified_books = select(Notification.related_id).where(
+        Notification.type == "achievement",
+        Notification.related_id.isnot(None)
+    )
+    completed_books = session.exec(
+        select(Book.id, Book.title).where(
+            Book.pages_read >= Book.pages_total,
+            Book.pages_total > 0,
+            Book.id.notin_(notified_books)
+        )
+    ).all()
+    
+    pending.extend(
+        Notification(
+            type="achievement",
+            title="Книга завершена",
+            message=f"📚 Поздравляем! Вы завершили книгу '{book_title}'!",
+            related_id=book_id
+        )
+        for book_id, book_title in completed_books
+    )
+    
+    # Проверяем обучение (суммируем минуты прямо в SQL)
+    total_today_minutes = session.exec(
+        select(func.coalesce(func.sum(LearningLog.minutes), 0)).where(LearningLog.log_date == today)
+    ).one()
+    if total_today_minutes >= 60:
+        message = f"🐍 Потрясающе! Вы изучали Python {total_today_minutes} минут сегодня!"
+        notification_type = "motivation"
         
-        # Проверяем обучение
-        learning_logs = session.exec(
-            select(LearningLog).where(LearningLog.log_date == today)
-        ).all()
+        # Проверяем, не создано ли уже уведомление
+        existing = session.exec(
+            select(Notification).where(
+                Notification.type == notification_type,
+                Notification.title == "Интенсивное обучение",
+                Notification.created_date == today
+            )
+        ).first()
         
-        total_today_minutes = sum(log.minutes for log in learning_logs)
-        if total_today_minutes >= 60:
-            message = f"🐍 Потрясающе! Вы изучали Python {total_today_minutes} минут сегодня!"
-            notification_type = "motivation"
-            
-            # Проверяем, не создано ли уже уведомление
-            existing = session.exec(
-                select(Notification).where(
-                    Notification.type == notification_type,
-                    Notification.title == "Интенсивное обучение",
-                    Notification.created_date == today
-                )
-            ).first()
-            
-            if not existing:
-                notification = Notification(
-                    type=notification_type,
-                    title="Интенсивное обучение",
-                    message=message
-                )
-                session.add(notification)
-                session.commit()
+        if not existing:
+            pending.append(Notification(
+                type=notification_type,
+                title="Интенсивное обучение",
+                message=message
+            ))
+    
+    session.add_all(pending)
 
+@st.cache_data(ttl=30, show_spinner=False)
 def get_unread_notifications():
     """
-    Получает непрочитанные уведомления
+    Получает непрочитанные уведомления, сгруппированные по типу
     
-    Возвращает список уведомлений, отсортированных по дате создания (новые первыми)
+    Возвращает словарь {тип: список уведомлений}, внутри группы новые первыми.
+    База сразу сортирует по (тип, дата), поэтому группы собираются за один проход.
+    Результат кэшируется на 30 секунд; после изменения уведомлений кэш
+    сбрасывается через get_unread_notifications.clear().
     """
     with get_session() as session:
         notifications = session.exec(
-            select(Notification).where(Notification.is_read == False).order_by(Notification.created_date.desc())
+            select(Notification)
+            .where(Notification.is_read == False)
+            .order_by(Notification.type, Notification.created_date.desc())
         ).all()
-        return notifications
+    return {
+        notification_type: list(group)
+        for notification_type, group in groupby(notifications, key=lambda n: n.type)
+    }
 
 def mark_notification_read(notification_id):
     """
     Отмечает уведомление как прочитанное
     
+    Выполняется одним UPDATE, без предварительной загрузки объекта.
+    
     Args:
         notification_id: ID уведомления для отметки как прочитанное
     """
-    with get_session() as session:
-        notification = session.get(Notification, notification_id)
-        if notification:
-            notification.is_read = True
-            session.add(notification)
-            session.commit()
+    session = get_request_session()
+    session.exec(
+        update(Notification).where(Notification.id == notification_id).values(is_read=True)
+    )
+    session.commit()
+    bump_data_version()
+    get_unread_notifications.clear()
+
+def mark_notification_unread(notification_id):
+    """
+    Возвращает уведомлению статус непрочитанного
+    
+    Выполняется одним UPDATE, без предварительной загрузки объекта.
+    
+    Args:
+        notification_id: ID уведомления
+    """
+    session = get_request_session()
+    session.exec(
+        update(Notification).where(Notification.id == notification_id).values(is_read=False)
+    )
+    session.commit()
+    bump_data_version()
+    get_unread_notifications.clear()
+
+def mark_all_read(notification_ids):
+    """
+    Отмечает несколько уведомлений как прочитанные одним UPDATE
+    
+    Args:
+        notification_ids: список ID уведомлений
+    """
+    session = get_request_session()
+    session.exec(
+        update(Notification).where(Notification.id.in_(notification_ids)).values(is_read=True)
+    )
+    session.commit()
+    bump_data_version()
+    get_unread_notifications.clear()
 
 # =============================================================================
 # МИГРАЦИЯ ДАННЫХ
 # =============================================================================
 # Эта функция обновляет существующие данные при изменении структуры базы
 
-def migrate_show_data():
+def migrate_show_data(session):
     """
     Обновляет total_watched_episodes для существующих сериалов
     
     Это нужно при добавлении нового поля в модель Show.
     Для существующих записей устанавливает базовое значение на основе текущих серий.
+    
+    Args:
+        session: открытая сессия БД; коммит выполняет вызывающий код
+    """
+    # Одним UPDATE вместо загрузки и перебора всех сериалов в Python.
+    # Примерная оценка: (сезон - 1) * среднее_количество_серий + текущие_серии
+    # Для простоты используем текущие серии как базовое значение
+    session.exec(
+        update(Show)
+        .where(Show.total_watched_episodes == 0)  # Если поле не заполнено
+        .values(total_watched_episodes=Show.episode)
+    )
+
+# =============================================================================
+# КЭШИРОВАНИЕ СЛУЖЕБНЫХ ОПЕРАЦИЙ
+# =============================================================================
+# Streamlit перезапускает весь скрипт при каждом клике, поэтому служебная
+# работа кэшируется и не повторяется на каждый перезапуск
+
+@st.cache_resource
+def data_version_counter():
+    """
+    Общий для всего процесса счетчик версии данных
+    
+    Используется как ключ для кэшированных запросов: любое изменение данных
+    увеличивает версию, и кэш со старой версией больше не используется.
+    Счетчик общий для всех вкладок браузера, поэтому изменения из одной
+    вкладки сразу видны в другой.
+    """
+    return {"value": 0}
+
+def get_data_version():
+    """Возвращает текущую версию данных"""
+    return data_version_counter()["value"]
+
+def bump_data_version():
+    """Увеличивает версию данных; вызывается после каждого изменения в базе"""
+    data_version_counter()["value"] += 1
+
+@st.cache_resource
+def setup_database():
+    """
+    Создает таблицы и выполняет миграцию данных
+    
+    @st.cache_resource гарантирует, что это происходит один раз за процесс,
+    а не при каждом перезапуске скрипта.
     """
+    init_db()
     with get_session() as session:
-        shows = session.exec(select(Show)).all()
-        for show in shows:
-            if show.total_watched_episodes == 0:  # Если поле не заполнено
-                # Примерная оценка: (сезон - 1) * среднее_количество_серий + текущие_серии
-                # Для простоты используем текущие серии как базовое значение
-                show.total_watched_episodes = show.episode
-                session.add(show)
+        migrate_show_data(session)
+        session.commit()
+    return True
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def run_notification_checks(day, version):
+    """
+    Проверяет дедлайны и достижения только после изменения данных
+    
+    Args:
+        day: текущая дата; ключ кэша, чтобы проверки выполнялись заново в новый день
+        version: версия данных (get_data_version()); после любой записи
+            проверки выполняются на следующем запуске, а не через ttl
+    
+    Все изменения сохраняются одной транзакцией в одной сессии.
+    """
+    with get_session() as session:
+        check_deadline_reminders(session)
+        check_achievements(session)
         session.commit()
+    # Новые уведомления должны сразу попасть в панель, а не ждать ttl кэша
+    get_unread_notifications.clear()
+    return day
 
-# Выполняем миграцию
-migrate_show_data()
+# Инициализация базы данных и проверка уведомлений при загрузке страницы
+setup_database()
+run_notification_checks(date.today(), get_data_version())
 
-# Проверяем уведомления при загрузке страницы
-check_deadline_reminders()
-check_achievements()
+# Освобождаем сессию прошлого запуска: если он был прерван через st.rerun(),
+# до конца скрипта он не дошел и сессию не закрыл
+close_request_session()
 
 st.title("📔 Мой дневник")
 st.caption("Задачи . Сериалы . Книги . Обучение Python")
@@ -256,16 +398,16 @@ notifications = get_unread_notifications()
 if notifications:
     st.subheader("🔔 Уведомления")
     
-    # Группируем уведомления по типам
-    deadline_notifications = [n for n in notifications if n.type == "deadline"]
-    achievement_notifications = [n for n in notifications if n.type == "achievement"]
-    motivation_notifications = [n for n in notifications if n.type == "motivation"]
+    # Уведомления уже сгруппированы по типам
+    deadline_notifications = notifications.get("deadline", [])
+    achievement_notifications = notifications.get("achievement", [])
+    motivation_notifications = notifications.get("motivation", [])
     
     # Показываем уведомления о дедлайнах
     if deadline_notifications:
         st.warning("⏰ **Приближающиеся дедлайны:**")
         for notif in deadline_notifications:
-            col1, col2 = st.columns([4, 1])
+            col1, col2 = st.columns(NOTIFICATION_ROW_COLUMNS)
             with col1:
                 st.write(f"• {notif.message}")
             with col2:
@@ -277,7 +419,7 @@ if notifications:
     if achievement_notifications:
         st.success("🎉 **Достижения:**")
         for notif in achievement_notifications:
-            col1, col2 = st.columns([4, 1])
+            col1, col2 = st.columns(NOTIFICATION_ROW_COLUMNS)
             with col1:
                 st.write(f"• {notif.message}")
             with col2:
@@ -289,7 +431,7 @@ if notifications:
     if motivation_notifications:
         st.info("💪 **Мотивация:**")
         for notif in motivation_notifications:
-            col1, col2 = st.columns([4, 1])
+            col1, col2 = st.columns(NOTIFICATION_ROW_COLUMNS)
             with col1:
                 st.write(f"• {notif.message}")
             with col2:
@@ -299,8 +441,7 @@ if notifications:
     
     # Кнопка "Отметить все как прочитанные"
     if st.button("📭 Отметить все как прочитанные"):
-        for notif in notifications:
-            mark_notification_read(notif.id)
+        mark_all_read([notif.id for group in notifications.values() for notif in group])
         st.rerun()
     
     st.divider()
@@ -309,50 +450,176 @@ if notifications:
 # ПОИСК ПО ВСЕМ РАЗДЕЛАМ
 # =============================================================================
 # Глобальный поиск по задачам, сериалам, книгам и обучению
+
+# Более короткие запросы находят почти все записи и только нагружают базу
+MIN_SEARCH_LENGTH = 3
+
+@st.cache_data(ttl=30, show_spinner=False)
+def search_all(query, version):
+    """
+    Ищет запрос во всех разделах одним SQL-запросом (UNION ALL)
+    
+    Совпадения ищутся в полнотекстовом индексе search_idx (SQLite FTS5):
+    каждое слово запроса считается началом слова в названии, авторе или заметках.
+    
+    Каждая ветка запроса возвращает строки одинаковой формы:
+    - kind: раздел ("task", "show", "book", "learning")
+    - id, title: идентификатор и название (тема для обучения)
+    - extra: приоритет задачи / автор книги / дата записи обучения
+    - num: выполнена ли задача / сезон / прочитано страниц / минуты
+    - num2: серия сериала / всего страниц в книге
+    
+    Результат кэшируется на 30 секунд, поэтому повторные перезапуски скрипта
+    с тем же запросом не обращаются к базе.
+    
+    Args:
+        query: строка поиска
+        version: версия данных (get_data_version()); после любого изменения
+            данных ключ меняется, и поиск не показывает удаленные записи
+    
+    Returns:
+        Словарь {раздел: список строк}
+    """
+    results = {"task": [], "show": [], "book": [], "learning": []}
+    
+    # Каждое слово запроса превращаем в префиксный поиск FTS5: "слово"*
+    words = query.split()
+    if not words:
+        return results
+    match = " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+    
+    # Полнотекстовое условие вычисляется один раз для всех разделов (CTE),
+    # а каждая ветка UNION берет из найденного только свои id
+    hits = select(search_idx.c.kind, search_idx.c.ref_id).where(
+        literal_column("search_idx").op("MATCH")(match)
+    ).cte("hits")
+    
+    def matching_ids(kind):
+        """Подзапрос id записей раздела, найденных в индексе"""
+        return select(hits.c.ref_id).where(hits.c.kind == kind)
+    
+    statement = union_all(
+        select(
+            literal("task").label("kind"), Task.id, Task.title.label("title"),
+            Task.priority.label("extra"), cast(Task.done, Integer).label("num"), null().label("num2")
+        ).where(Task.id.in_(matching_ids("task"))),
+        select(
+            literal("show"), Show.id, Show.title,
+            null(), Show.season, Show.episode
+        ).where(Show.id.in_(matching_ids("show"))),
+        select(
+            literal("book"), Book.id, Book.title,
+            Book.author, Book.pages_read, Book.pages_total
+        ).where(Book.id.in_(matching_ids("book"))),
+        select(
+            literal("learning"), LearningLog.id, LearningLog.topic,
+            cast(LearningLog.log_date, String), LearningLog.minutes, null()
+        ).where(LearningLog.id.in_(matching_ids("learning"))),
+    )
+    
+    with get_session() as session:
+        for row in session.exec(statement).all():
+            results[row.kind].append(row)
+    return results
+
 search_query = st.text_input("🔍 Поиск по всем разделам", placeholder="Введите название задачи, книги, сериала или темы обучения...")
 
 # Если есть поисковый запрос, показываем результаты
-if search_query:
+if search_query and len(search_query.strip()) < MIN_SEARCH_LENGTH:
+    st.caption(f"Введите минимум {MIN_SEARCH_LENGTH} символа для поиска")
+elif search_query:
     st.subheader(f"Результаты поиска: '{search_query}'")
     
-    with get_session() as session:
-        # Поиск в задачах
-        tasks = session.exec(select(Task).where(Task.title.contains(search_query))).all()
-        # Поиск в сериалах
-        shows = session.exec(select(Show).where(Show.title.contains(search_query))).all()
-        # Поиск в книгах
-        books = session.exec(select(Book).where(Book.title.contains(search_query) | Book.author.contains(search_query))).all()
-        # Поиск в обучении
-        learning_logs = session.exec(select(LearningLog).where(LearningLog.topic.contains(search_query) | LearningLog.notes.contains(search_query))).all()
+    results = search_all(search_query, get_data_version())
+    tasks = results["task"]
+    shows = results["show"]
+    books = results["book"]
+    learning_logs = results["learning"]
     
     # Показываем результаты поиска
     if tasks:
         st.write("**📋 Задачи:**")
         for task in tasks:
-            status = "✅" if task.done else "⏰"
-            st.write(f"- {status} {task.title} ({task.priority})")
+            status = "✅" if task.num else "⏰"
+            st.write(f"- {status} {task.title} ({task.extra})")
     
     if shows:
         st.write("**🎬 Сериалы:**")
         for show in shows:
-            st.write(f"- {show.title} - S{show.season} E{show.episode}")
+            st.write(f"- {show.title} - S{show.num} E{show.num2}")
     
     if books:
         st.write("**📚 Книги:**")
         for book in books:
-            progress = f"{book.pages_read}/{book.pages_total}" if book.pages_total > 0 else f"{book.pages_read} стр."
-            st.write(f"- {book.title} ({book.author}) - {progress}")
+            progress = f"{book.num}/{book.num2}" if book.num2 > 0 else f"{book.num} стр."
+            st.write(f"- {book.title} ({book.extra}) - {progress}")
     
     if learning_logs:
         st.write("**🐍 Обучение:**")
         for log in learning_logs:
-            st.write(f"- {log.topic} - {log.minutes} мин ({log.log_date})")
+            st.write(f"- {log.title} - {log.num} мин ({log.extra})")
     
     if not any([tasks, shows, books, learning_logs]):
         st.info("Ничего не найдено")
     
     st.divider()
 
+# =============================================================================
+# ИЗМЕНЕНИЕ ЗАДАЧ
+# =============================================================================
+
+# Готовые INSERT/UPDATE/DELETE для частых действий с задачами: значения передаются
+# через bindparam, поэтому скомпилированный SQL берется из кэша SQLAlchemy
+INSERT_TASK = insert(Task).returning(Task.id)
+UPDATE_TASK_DONE = update(Task).where(Task.id == bindparam("task_id")).values(done=bindparam("done"))
+DELETE_TASK = delete(Task).where(Task.id == bindparam("task_id"))
+
+def create_task(title, priority, due=None, desc=""):
+    """
+    Создает задачу одним INSERT ... RETURNING id
+    
+    В отличие от session.add + commit не создает ORM-объект и не требует
+    отдельного запроса, чтобы узнать id новой записи.
+    
+    Args:
+        title: название задачи
+        priority: приоритет ("Низкий", "Средний", "Высокий")
+        due: дедлайн (может быть пустым)
+        desc: описание
+    
+    Returns:
+        ID созданной задачи
+    """
+    session = get_request_session()
+    task_id = session.connection().execute(
+        INSERT_TASK, {"title": title, "priority": priority, "due": due, "desc": desc, "done": False}
+    ).scalar_one()
+    session.commit()
+    bump_data_version()
+    return task_id
+
+def apply_task_changes(done_changes, deleted_ids):
+    """
+    Применяет изменения из таблицы задач в одной транзакции
+    
+    Отметки выполнения и удаления отправляются пакетами (executemany)
+    через готовые UPDATE_TASK_DONE и DELETE_TASK, без загрузки объектов.
+    
+    Args:
+        done_changes: список словарей {"task_id": ..., "done": ...}
+        deleted_ids: список ID задач для удаления
+    """
+    if not done_changes and not deleted_ids:
+        return
+    session = get_request_session()
+    connection = session.connection()
+    if done_changes:
+        connection.execute(UPDATE_TASK_DONE, done_changes)
+    if deleted_ids:
+        connection.execute(DELETE_TASK, [{"task_id": task_id} for task_id in deleted_ids])
+    session.commit()
+    bump_data_version()
+
 # =============================================================================
 # БЫСТРЫЕ ДЕЙСТВИЯ
 # =============================================================================
@@ -402,10 +669,7 @@ if st.session_state.get("quick_task", False):
                 priority = st.selectbox("Приоритет", ["Низкий", "Средний", "Высокий"])
                 submit = st.form_submit_button("Добавить")
                 if submit and title.strip():
-                    with get_session() as session:
-                        task = Task(title=title.strip(), priority=priority, done=False)
-                        session.add(task)
-                        session.commit()
+                    create_task(title.strip(), priority)
                     st.success("Задача добавлена!")
                     st.session_state.quick_task = False
                     st.rerun()
@@ -423,10 +687,11 @@ if st.session_state.get("quick_book", False):
                 author = st.text_input("Автор")
                 submit = st.form_submit_button("Добавить")
                 if submit and title.strip():
-                    with get_session() as session:
-                        book = Book(title=title.strip(), author=author.strip())
-                        session.add(book)
-                        session.commit()
+                    session = get_request_session()
+                    book = Book(title=title.strip(), author=author.strip())
+                    session.add(book)
+                    session.commit()
+                    bump_data_version()
                     st.success("Книга добавлена!")
                     st.session_state.quick_book = False
                     st.rerun()
@@ -443,10 +708,11 @@ if st.session_state.get("quick_show", False):
                 title = st.text_input("Название сериала")
                 submit = st.form_submit_button("Добавить")
                 if submit and title.strip():
-                    with get_session() as session:
-                        show = Show(title=title.strip())
-                        session.add(show)
-                        session.commit()
+                    session = get_request_session()
+                    show = Show(title=title.strip())
+                    session.add(show)
+                    session.commit()
+                    bump_data_version()
                     st.success("Сериал добавлен!")
                     st.session_state.quick_show = False
                     st.rerun()
@@ -464,10 +730,11 @@ if st.session_state.get("quick_learning", False):
                 minutes = st.number_input("Минуты", min_value=1, value=30)
                 submit = st.form_submit_button("Добавить")
                 if submit and topic.strip():
-                    with get_session() as session:
-                        learning_log = LearningLog(topic=topic.strip(), minutes=minutes, log_date=date.today())
-                        session.add(learning_log)
-                        session.commit()
+                    session = get_request_session()
+                    learning_log = LearningLog(topic=topic.strip(), minutes=minutes, log_date=date.today())
+                    session.add(learning_log)
+                    session.commit()
+                    bump_data_version()
                     st.success("Запись добавлена!")
                     st.session_state.quick_learning = False
                     st.rerun()
@@ -478,32 +745,218 @@ if st.session_state.get("quick_learning", False):
 
 st.divider()
 
+# =============================================================================
+# ДАННЫЕ ДЛЯ АНАЛИТИКИ
+# =============================================================================
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def analytics_snapshot(version):
+    """
+    Собирает данные для вкладки аналитики
+    
+    Суммы и количества считает SQLite, в Python попадают только готовые числа.
+    Для графиков загружаются только нужные столбцы, а не объекты целиком.
+    
+    Args:
+        version: версия данных (get_data_version()); ключ кэша, поэтому
+            запросы повторяются только после изменения данных. Читается
+            только текущая версия, так что хватает нескольких записей кэша
+    
+    Returns:
+        Словарь с итогами по разделам, строками и таблицами DataFrame для графиков
+    """
+    with get_session() as session:
+        return {
+            "tasks": tuple(session.exec(
+                select(func.count(Task.id), func.coalesce(func.sum(cast(Task.done, Integer)), 0))
+            ).one()),
+            "priorities": session.exec(
+                select(Task.priority, func.count(Task.id), func.sum(cast(Task.done, Integer)))
+                .group_by(Task.priority)
+            ).all(),
+            "shows": tuple(session.exec(
+                select(func.count(Show.id), func.coalesce(func.sum(Show.total_watched_episodes), 0))
+            ).one()),
+            "books": tuple(session.exec(
+                select(func.count(Book.id), func.coalesce(func.sum(Book.pages_read), 0))
+            ).one()),
+            "completed_books": session.exec(
+                select(func.count()).select_from(Book)
+                .where(Book.pages_read >= Book.pages_total, Book.pages_total > 0)
+            ).one(),
+            "learning": tuple(session.exec(
+                select(func.coalesce(func.sum(LearningLog.minutes), 0), func.count(distinct(LearningLog.log_date)))
+            ).one()),
+            # Таблицы для графиков pandas строит прямо из курсора
+            "shows_df": pd.read_sql_query(
+                select(Show.title, Show.season, Show.episode, Show.total_watched_episodes),
+                session.connection()
+            ),
+            "books_df": pd.read_sql_query(
+                select(Book.title, Book.pages_read, Book.pages_total).where(Book.pages_total > 0),
+                session.connection()
+            ),
+            "daily_learning": session.exec(
+                select(LearningLog.log_date, func.sum(LearningLog.minutes))
+                .group_by(LearningLog.log_date)
+                .order_by(LearningLog.log_date)
+            ).all(),
+        }
+
+# =============================================================================
+# ДАННЫЕ ДЛЯ ВКЛАДОК
+# =============================================================================
+# Списки кэшируются по версии данных и хранятся как строки с нужными
+# столбцами, а не ORM-объекты, привязанные к сессии. У загрузчиков есть
+# еще и ttl: после каждой записи версия меняется, и без срока жизни
+# данные старых версий копились бы в кэше
+
+# Сколько задач показывать на одной странице вкладки "Задачи"
+TASKS_PAGE_SIZE = 50
+
+# Сколько уведомлений показывать на одной странице вкладки "Уведомления"
+NOTIFICATIONS_PAGE_SIZE = 25
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_task_count(version):
+    """
+    Возвращает общее количество задач
+    
+    Args:
+        version: версия данных (get_data_version()), ключ кэша
+    """
+    with get_session() as session:
+        return session.exec(select(func.count()).select_from(Task)).one()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_tasks_page(version, page):
+    """
+    Загружает одну страницу списка задач
+    
+    Сортировка совпадает с индексом ix_task_list_order: сначала невыполненные,
+    затем по дедлайну, задачи без дедлайна в конце.
+    
+    Args:
+        version: версия данных (get_data_version()), ключ кэша
+        page: номер страницы, начиная с 0
+    
+    Returns:
+        Список строк (id, title, priority, due, desc, done)
+    """
+    with get_session() as session:
+        return session.exec(
+            select(Task.id, Task.title, Task.priority, Task.due, Task.desc, Task.done)
+            .order_by(Task.done.asc(), Task.due.is_(None), Task.due.asc())
+            .offset(page * TASKS_PAGE_SIZE)
+            .limit(TASKS_PAGE_SIZE)
+        ).all()
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def load_calendar_entries(version, start, end):
+    """
+    Загружает задачи и записи обучения за период (включительно)
+    
+    Args:
+        version: версия данных (get_data_version()), ключ кэша
+        start: первый день периода
+        end: последний день периода
+    
+    Returns:
+        Кортеж (задачи, записи обучения) в виде списков строк
+    """
+    with get_session() as session:
+        tasks = session.exec(
+            select(Task.title, Task.priority, Task.due, Task.desc, Task.done)
+            .where(Task.due.between(start, end))
+        ).all()
+        learning_logs = session.exec(
+            select(LearningLog.topic, LearningLog.minutes, LearningLog.notes, LearningLog.log_date)
+            .where(LearningLog.log_date.between(start, end))
+        ).all()
+        return tasks, learning_logs
+
+def shift_calendar_month(delta):
+    """
+    Сдвигает отображаемый месяц календаря на delta месяцев
+    
+    Вызывается как on_click кнопок навигации: состояние меняется до
+    перезапуска скрипта, поэтому каждый клик дает ровно один проход
+    вместо двух (клик + st.rerun), а серия быстрых кликов просто
+    накапливается в st.session_state.
+    """
+    month_index = st.session_state.current_year * 12 + st.session_state.current_month - 1 + delta
+    st.session_state.current_year, month = divmod(month_index, 12)
+    st.session_state.current_month = month + 1
+
+def shift_page(state_key, delta):
+    """
+    Переключает страницу списка, номер которой хранится в st.session_state[state_key]
+    
+    Используется как on_click кнопок "назад"/"вперед": номер меняется
+    до перезапуска, поэтому отдельный st.rerun() не нужен.
+    """
+    st.session_state[state_key] = st.session_state.get(state_key, 0) + delta
+
+@st.cache_resource(show_spinner=False)
+def month_weeks(year, month):
+    """
+    Возвращает сетку месяца (недели по 7 дней, 0 - день другого месяца)
+    
+    Результат общий для всех сессий и не копируется, поэтому отдается
+    неизменяемым кортежем кортежей.
+    """
+    return tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+
 # =============================================================================
 # ОСНОВНЫЕ ВКЛАДКИ ПРИЛОЖЕНИЯ
 # =============================================================================
+def tab_fragment(render_tab):
+    """
+    Оборачивает функцию вкладки в st.fragment
+    
+    Действия внутри вкладки (пагинация, навигация по календарю, ввод в формы)
+    перезапускают только ее фрагмент, а не весь скрипт. Изменения данных
+    по-прежнему вызывают st.rerun() всего приложения, чтобы обновились
+    уведомления и другие вкладки.
+    
+    Фрагмент может перезапускаться отдельно от скрипта, поэтому сессию
+    базы данных он освобождает сам.
+    """
+    @wraps(render_tab)
+    def render():
+        try:
+            render_tab()
+        finally:
+            close_request_session()
+    return st.fragment(render)
+
 # Создаем вкладки для разных разделов приложения
 tabs = st.tabs(["📊 Аналитика", "✅ Задачи", "🎬 Сериалы", "📚 Книги", "🐍 Обучение Python", "📅 Календарь", "🔔 Уведомления"])
 
-with tabs[0]:
+@tab_fragment
+def render_analytics_tab():
     """
     ВКЛАДКА АНАЛИТИКИ
     Показывает статистику и графики по всем разделам
     """
     st.subheader("📊 Аналитика и статистика")
     
-    # Получаем данные для аналитики
-    with get_session() as session:
-        tasks = session.exec(select(Task)).all()
-        shows = session.exec(select(Show)).all()
-        books = session.exec(select(Book)).all()
-        learning_logs = session.exec(select(LearningLog)).all()
+    # Получаем данные для аналитики (из кэша, пока данные не менялись)
+    snapshot = analytics_snapshot(get_data_version())
+    total_tasks, completed_tasks = snapshot["tasks"]
+    priority_rows = snapshot["priorities"]
+    total_shows, total_episodes = snapshot["shows"]
+    total_books, total_pages = snapshot["books"]
+    completed_books = snapshot["completed_books"]
+    total_learning_time, learning_days = snapshot["learning"]
+    shows_df = snapshot["shows_df"]
+    books_df = snapshot["books_df"]
+    daily_learning = snapshot["daily_learning"]
     
     # Основные метрики
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_tasks = len(tasks)
-        completed_tasks = len([t for t in tasks if t.done])
         completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
         st.metric(
@@ -513,9 +966,6 @@ with tabs[0]:
         )
     
     with col2:
-        total_shows = len(shows)
-        total_episodes = sum(s.total_watched_episodes for s in shows)
-        
         st.metric(
             "Сериалы", 
             f"{total_shows} сериалов",
@@ -523,9 +973,6 @@ with tabs[0]:
         )
     
     with col3:
-        total_books = len(books)
-        total_pages = sum(b.pages_read for b in books)
-        
         st.metric(
             "Книги", 
             f"{total_books} книг",
@@ -533,9 +980,6 @@ with tabs[0]:
         )
     
     with col4:
-        total_learning_time = sum(l.minutes for l in learning_logs)
-        learning_days = len(set(l.log_date for l in learning_logs))
-        
         st.metric(
             "Обучение", 
             f"{total_learning_time} мин",
@@ -550,78 +994,48 @@ with tabs[0]:
     with col1:
         st.subheader("📈 Прогресс задач")
         
-        # Статистика по приоритетам
-        priority_stats = {}
-        for task in tasks:
-            priority = task.priority
-            if priority not in priority_stats:
-                priority_stats[priority] = {"total": 0, "completed": 0}
-            priority_stats[priority]["total"] += 1
-            if task.done:
-                priority_stats[priority]["completed"] += 1
-        
-        for priority, stats in priority_stats.items():
-            completion_rate = (stats["completed"] / stats["total"] * 100) if stats["total"] > 0 else 0
-            st.write(f"**{priority}**: {stats['completed']}/{stats['total']} ({completion_rate:.1f}%)")
-            st.progress(completion_rate / 100)
+        # Статистика по приоритетам (GROUP BY priority) одним графиком
+        if priority_rows:
+            priority_df = pd.DataFrame(priority_rows, columns=["Приоритет", "total", "completed"]).set_index("Приоритет")
+            priority_df["Выполнено, %"] = priority_df["completed"] / priority_df["total"] * 100
+            st.bar_chart(priority_df["Выполнено, %"])
+            st.caption(" · ".join(
+                f"{priority}: {completed}/{total}" for priority, total, completed in priority_rows
+            ))
         
         # График обучения по дням
         st.subheader("📚 Активность чтения")
-        if books:
-            reading_progress = []
-            for book in books:
-                if book.pages_total > 0:
-                    progress = (book.pages_read / book.pages_total) * 100
-                    reading_progress.append({
-                        "Книга": book.title[:20] + "..." if len(book.title) > 20 else book.title,
-                        "Прогресс": progress
-                    })
-            
-            if reading_progress:
-                import pandas as pd
-                df = pd.DataFrame(reading_progress)
-                st.bar_chart(df.set_index("Книга")["Прогресс"])
+        if not books_df.empty:
+            # Прогресс считается сразу для всего столбца, без цикла по книгам
+            titles = books_df["title"]
+            reading_df = books_df.assign(
+                Книга=titles.str.slice(0, 20).where(titles.str.len() <= 20, titles.str.slice(0, 20) + "..."),
+                Прогресс=books_df["pages_read"] / books_df["pages_total"] * 100
+            )
+            st.bar_chart(reading_df.set_index("Книга")["Прогресс"])
     
     with col2:
         st.subheader("🎬 Статистика сериалов")
         
-        if shows:
-            # Топ сериалов по количеству серий
-            show_stats = []
-            for show in shows:
-                show_stats.append({
-                    "Сериал": show.title[:15] + "..." if len(show.title) > 15 else show.title,
-                    "Текущий сезон": f"S{show.season} E{show.episode}",
-                    "Всего серий": show.total_watched_episodes
-                })
-            
-            import pandas as pd
-            df = pd.DataFrame(show_stats)
-            st.dataframe(df, use_container_width=True)
+        if not shows_df.empty:
+            # Топ сериалов по количеству серий; столбцы считаются целиком
+            titles = shows_df["title"]
+            show_stats = pd.DataFrame({
+                "Сериал": titles.str.slice(0, 15).where(titles.str.len() <= 15, titles.str.slice(0, 15) + "..."),
+                "Текущий сезон": "S" + shows_df["season"].astype(str) + " E" + shows_df["episode"].astype(str),
+                "Всего серий": shows_df["total_watched_episodes"]
+            })
+            st.dataframe(show_stats, use_container_width=True)
         
         st.subheader("🐍 Обучение по дням")
         
-        if learning_logs:
-            # Группируем по дням
-            daily_learning = {}
-            for log in learning_logs:
-                date_str = str(log.log_date)
-                if date_str not in daily_learning:
-                    daily_learning[date_str] = 0
-                daily_learning[date_str] += log.minutes
+        if daily_learning:
+            # Минуты уже сгруппированы и отсортированы по дням в SQL
+            learning_df = pd.DataFrame(daily_learning, columns=["Дата", "Минуты"])
+            learning_df["Дата"] = learning_df["Дата"].astype(str)
             
             # Создаем график
-            learning_data = []
-            for date_str, minutes in sorted(daily_learning.items()):
-                learning_data.append({
-                    "Дата": date_str,
-                    "Минуты": minutes
-                })
-            
-            if learning_data:
-                import pandas as pd
-                df = pd.DataFrame(learning_data)
-                st.line_chart(df.set_index("Дата")["Минуты"])
+            st.line_chart(learning_df.set_index("Дата")["Минуты"])
     
     # Цели и достижения
     st.divider()
@@ -650,10 +1064,13 @@ with tabs[0]:
         if total_episodes > 0:
             st.info(f"🎬 Просмотрено {total_episodes} серий")
         if total_books > 0:
-            completed_books = len([b for b in books if b.pages_read >= b.pages_total and b.pages_total > 0])
             st.info(f"📚 Завершено {completed_books} книг")
 
-with tabs[1]:
+with tabs[0]:
+    render_analytics_tab()
+
+@tab_fragment
+def render_tasks_tab():
     """
     ВКЛАДКА ЗАДАЧ
     Управление задачами: добавление, выполнение, удаление
@@ -672,54 +1089,74 @@ with tabs[1]:
         desc = st.text_area("Описание", height=80)
         submit = st.form_submit_button("Сохранить")
         if submit and title.strip():
-            with get_session() as session:
-                task = Task(title=title.strip(), priority=priority, due=due, desc=desc.strip(), done=False)
-                session.add(task)
-                session.commit()
+            create_task(title.strip(), priority, due, desc.strip())
             st.success("Задача сохранена")
             st.rerun()
 
     st.divider()
 
-    # Список задач из БД
-    with get_session() as session:
-        tasks = session.exec(
-            select(Task).order_by(Task.done.asc(), Task.due.is_(None), Task.due.asc())
-        ).all()
+    # Список задач из БД: выбираем только текущую страницу (LIMIT/OFFSET),
+    # сортировка совпадает с индексом ix_task_list_order
+    total_tasks = load_task_count(get_data_version())
+    page_count = max((total_tasks + TASKS_PAGE_SIZE - 1) // TASKS_PAGE_SIZE, 1)
+    page = min(st.session_state.get("task_page", 0), page_count - 1)
+    st.session_state.task_page = page
+    tasks = load_tasks_page(get_data_version(), page)
+
+    if page_count > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("◀ Назад", key="task_page_prev", disabled=page == 0,
+                      on_click=shift_page, args=("task_page", -1))
+        with col2:
+            st.caption(f"Страница {page + 1} из {page_count} · всего задач: {total_tasks}")
+        with col3:
+            st.button("Вперед ▶", key="task_page_next", disabled=page >= page_count - 1,
+                      on_click=shift_page, args=("task_page", 1))
 
     if tasks:
-        for t in tasks:
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-            with col1:
-                meta = f"{t.priority}"
-                if t.due:
-                    meta += f" · до {t.due}"
-                st.markdown(f"**{t.title}** — {meta}")
-                if t.desc:
-                    st.caption(t.desc)
-            with col2:
-                if st.button("Готово" if not t.done else "Снять", key=f"task_done_{t.id}"):
-                    with get_session() as session:
-                        obj = session.get(Task, t.id)
-                        if obj:
-                            obj.done = not obj.done
-                            session.add(obj)
-                            session.commit()
-                    st.rerun()
-            with col3:
-                if st.button("Удалить", key=f"task_del_{t.id}"):
-                    with get_session() as session:
-                        obj = session.get(Task, t.id)
-                        if obj:
-                            session.delete(obj)
-                            session.commit()
-                    st.rerun()
-            with col4:
-                st.write("✅" if t.done else "—")
+        # Страница задач выводится одной таблицей; отметки "Готово" и "Удалить"
+        # копятся в форме и по кнопке применяются одним пакетом
+        tasks_df = pd.DataFrame(tasks, columns=["id", "Задача", "Приоритет", "Дедлайн", "Описание", "Готово"])
+        tasks_df["Удалить"] = False
+        # Ключ редактора меняется только после сохранения в этой сессии: общая
+        # версия данных растет и от чужих изменений, что сбрасывало бы отметки
+        editor_rev = st.session_state.setdefault("tasks_editor_rev", 0)
+        with st.form("tasks_editor_form"):
+            edited_df = st.data_editor(
+                tasks_df,
+                key=f"tasks_editor_{page}_{editor_rev}",
+                hide_index=True,
+                use_container_width=True,
+                disabled=["Задача", "Приоритет", "Дедлайн", "Описание"],
+                column_config={
+                    "id": None,
+                    "Дедлайн": st.column_config.DateColumn(format="YYYY-MM-DD"),
+                    "Готово": st.column_config.CheckboxColumn(),
+                    "Удалить": st.column_config.CheckboxColumn(),
+                }
+            )
+            if st.form_submit_button("Сохранить изменения"):
+                # Сравниваем с исходной страницей и отправляем только изменения
+                deleted = edited_df["Удалить"]
+                changed = (edited_df["Готово"] != tasks_df["Готово"]) & ~deleted
+                apply_task_changes(
+                    [
+                        {"task_id": int(task_id), "done": bool(done)}
+                        for task_id, done in zip(edited_df.loc[changed, "id"], edited_df.loc[changed, "Готово"])
+                    ],
+                    [int(task_id) for task_id in edited_df.loc[deleted, "id"]]
+                )
+                st.session_state.tasks_editor_rev = editor_rev + 1
+                st.rerun()
     else:
         st.info("Пока нет задач.")
 
-with tabs[2]:
+with tabs[1]:
+    render_tasks_tab()
+
+@tab_fragment
+def render_shows_tab():
     """
     ВКЛАДКА СЕРИАЛОВ
     Отслеживание прогресса просмотра сериалов
@@ -738,57 +1175,65 @@ with tabs[2]:
         total_episodes = st.number_input("Всего серий в сезоне", min_value=0, value=0, step=1)
         submit = st.form_submit_button("Сохранить")
         if submit and title.strip():
-            with get_session() as session:
-                show = Show(title=title.strip(), season=int(season), episode=int(episode), total=int(total_episodes))
-                session.add(show)
-                session.commit()
+            session = get_request_session()
+            # Уже просмотренные серии сразу учитываются в общем счетчике
+            # (миграция migrate_show_data выполняется только при старте)
+            show = Show(
+                title=title.strip(), season=int(season), episode=int(episode), total=int(total_episodes),
+                total_watched_episodes=int(episode)
+            )
+            session.add(show)
+            session.commit()
+            bump_data_version()
             st.success("Сериал сохранен")
             st.rerun()
     
     st.divider()
     
     # Список сериалов из БД
-    with get_session() as session:
-        shows = session.exec(select(Show).order_by(Show.title.asc())).all()
+    session = get_request_session()
+    shows = session.exec(select(Show).order_by(Show.title.asc())).all()
     
     if shows:
         for s in shows:
             progress = f"{s.episode}/{s.total}" if s.total else f"{s.episode}"
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+            col1, col2, col3, col4 = st.columns(SHOW_ROW_COLUMNS)
             with col1:
                 st.markdown(f"**{s.title}** — S{s.season} E{progress} (всего: {s.total_watched_episodes})")
             with col2:
                 if st.button("➕ Серия", key=f"show_next_{s.id}"):
-                    with get_session() as session:
-                        obj = session.get(Show, s.id)
-                        if obj:
-                            obj.episode += 1
-                            obj.total_watched_episodes += 1
-                            session.add(obj)
-                            session.commit()
+                    session = get_request_session()
+                    # Увеличение выполняется в самой базе, без чтения объекта
+                    session.exec(
+                        update(Show)
+                        .where(Show.id == s.id)
+                        .values(episode=Show.episode + 1, total_watched_episodes=Show.total_watched_episodes + 1)
+                    )
+                    session.commit()
+                    bump_data_version()
                     st.rerun()
             with col3:
                 if st.button("Новый сезон", key=f"show_new_season_{s.id}"):
-                    with get_session() as session:
-                        obj = session.get(Show, s.id)
-                        if obj:
-                            obj.season += 1
-                            obj.episode = 0
-                            session.add(obj)
-                            session.commit()
+                    session = get_request_session()
+                    session.exec(update(Show).where(Show.id == s.id).values(season=Show.season + 1, episode=0))
+                    session.commit()
+                    bump_data_version()
                     st.rerun()
             with col4:
                 if st.button("Удалить", key=f"show_del_{s.id}"):
-                    with get_session() as session:
-                        obj = session.get(Show, s.id)
-                        if obj:
-                            session.delete(obj)
-                            session.commit()
+                    session = get_request_session()
+                    session.exec(delete(Show).where(Show.id == s.id))
+                    session.commit()
+                    bump_data_version()
                     st.rerun()
     else:
         st.info("Пока нет сериалов.")
 
-with tabs[3]:
+with tabs[2]:
+    render_shows_tab()
+
+@tab_fragment
+def render_books_tab():
     """
     ВКЛАДКА КНИГ
     Отслеживание прогресса чтения книг
@@ -807,23 +1252,24 @@ with tabs[3]:
             pages_read = st.number_input("Прочитано страниц", min_value=0, value=0, step=1)
         submit = st.form_submit_button("Сохранить")
         if submit and title.strip():
-            with get_session() as session:
-                book = Book(title=title.strip(), author=author.strip(), pages_total=int(pages_total), pages_read=int(pages_read))
-                session.add(book)
-                session.commit()
+            session = get_request_session()
+            book = Book(title=title.strip(), author=author.strip(), pages_total=int(pages_total), pages_read=int(pages_read))
+            session.add(book)
+            session.commit()
+            bump_data_version()
             st.success("Книга сохранена")
             st.rerun()
     
     st.divider()
     
     # Список книг из БД
-    with get_session() as session:
-        books = session.exec(select(Book).order_by(Book.title.asc())).all()
+    session = get_request_session()
+    books = session.exec(select(Book).order_by(Book.title.asc())).all()
     
     if books:
         for b in books:
             ratio = (b.pages_read / b.pages_total * 100) if b.pages_total else 0
-            col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+            col1, col2, col3, col4 = st.columns(BOOK_ROW_COLUMNS)
             with col1:
                 st.markdown(f"**{b.title}** — {b.author}")
                 st.progress(min(1.0, ratio / 100.0), text=f"{b.pages_read} из {b.pages_total} ({ratio:.0f}%)")
@@ -831,25 +1277,26 @@ with tabs[3]:
                 new_read = st.number_input("Добавить страниц", min_value=0, value=0, step=1, key=f"book_add_{b.id}")
             with col3:
                 if st.button("➕ Прогресс", key=f"book_inc_{b.id}"):
-                    with get_session() as session:
-                        obj = session.get(Book, b.id)
-                        if obj:
-                            obj.pages_read += int(new_read)
-                            session.add(obj)
-                            session.commit()
+                    session = get_request_session()
+                    session.exec(update(Book).where(Book.id == b.id).values(pages_read=Book.pages_read + int(new_read)))
+                    session.commit()
+                    bump_data_version()
                     st.rerun()
             with col4:
                 if st.button("Удалить", key=f"book_del_{b.id}"):
-                    with get_session() as session:
-                        obj = session.get(Book, b.id)
-                        if obj:
-                            session.delete(obj)
-                            session.commit()
+                    session = get_request_session()
+                    session.exec(delete(Book).where(Book.id == b.id))
+                    session.commit()
+                    bump_data_version()
                     st.rerun()
     else:
         st.info("Пока нет книг.")
 
-with tabs[4]:
+with tabs[3]:
+    render_books_tab()
+
+@tab_fragment
+def render_learning_tab():
     """
     ВКЛАДКА ОБУЧЕНИЯ PYTHON
     Логирование времени изучения Python
@@ -863,24 +1310,25 @@ with tabs[4]:
         notes = st.text_area("Заметки", height=80)
         submit = st.form_submit_button("Добавить запись")
         if submit and topic.strip():
-            with get_session() as session:
-                learning_log = LearningLog(topic=topic.strip(), minutes=int(time_spent), notes=notes.strip(), log_date=date.today())
-                session.add(learning_log)
-                session.commit()
+            session = get_request_session()
+            learning_log = LearningLog(topic=topic.strip(), minutes=int(time_spent), notes=notes.strip(), log_date=date.today())
+            session.add(learning_log)
+            session.commit()
+            bump_data_version()
             st.success("Запись добавлена")
             st.rerun()
     
     st.divider()
     
     # Список записей обучения из БД
-    with get_session() as session:
-        learning_logs = session.exec(select(LearningLog).order_by(LearningLog.log_date.desc())).all()
+    session = get_request_session()
+    learning_logs = session.exec(select(LearningLog).order_by(LearningLog.log_date.desc())).all()
     
     if learning_logs:
         total_min = sum(r.minutes for r in learning_logs)
         st.metric("Всего времени", f"{total_min} мин")
         for r in learning_logs:
-            col1, col2, col3 = st.columns([3, 2, 1])
+            col1, col2, col3 = st.columns(LEARNING_ROW_COLUMNS)
             with col1:
                 st.markdown(f"**{r.topic}** — {r.log_date}")
                 if r.notes:
@@ -889,16 +1337,19 @@ with tabs[4]:
                 st.write(f"{r.minutes} мин")
             with col3:
                 if st.button("Удалить", key=f"learn_del_{r.id}"):
-                    with get_session() as session:
-                        obj = session.get(LearningLog, r.id)
-                        if obj:
-                            session.delete(obj)
-                            session.commit()
+                    session = get_request_session()
+                    session.exec(delete(LearningLog).where(LearningLog.id == r.id))
+                    session.commit()
+                    bump_data_version()
                     st.rerun()
     else:
         st.info("Пока нет записей обучения.")
 
-with tabs[5]:
+with tabs[4]:
+    render_learning_tab()
+
+@tab_fragment
+def render_calendar_tab():
     """
     ВКЛАДКА КАЛЕНДАРЯ
     Календарный вид с задачами и обучением
@@ -906,120 +1357,92 @@ with tabs[5]:
     st.subheader("Календарь")
     
     # Выбор месяца и года
+    if "current_month" not in st.session_state:
+        st.session_state.current_month = date.today().month
+        st.session_state.current_year = date.today().year
+    
     col1, col2, col3 = st.columns([1, 2, 1])
     with col1:
-        if st.button("◀️ Предыдущий"):
-            if "current_month" not in st.session_state:
-                st.session_state.current_month = date.today().month
-                st.session_state.current_year = date.today().year
-            if st.session_state.current_month == 1:
-                st.session_state.current_month = 12
-                st.session_state.current_year -= 1
-            else:
-                st.session_state.current_month -= 1
-            st.rerun()
+        st.button("◀️ Предыдущий", on_click=shift_calendar_month, args=(-1,))
     
     with col2:
-        if "current_month" not in st.session_state:
-            st.session_state.current_month = date.today().month
-            st.session_state.current_year = date.today().year
-        
         month_name = calendar.month_name[st.session_state.current_month]
         st.markdown(f"<h3 style='text-align: center;'>{month_name} {st.session_state.current_year}</h3>", unsafe_allow_html=True)
     
     with col3:
-        if st.button("Следующий ▶️"):
-            if "current_month" not in st.session_state:
-                st.session_state.current_month = date.today().month
-                st.session_state.current_year = date.today().year
-            if st.session_state.current_month == 12:
-                st.session_state.current_month = 1
-                st.session_state.current_year += 1
-            else:
-                st.session_state.current_month += 1
-            st.rerun()
+        st.button("Следующий ▶️", on_click=shift_calendar_month, args=(1,))
     
-    # Получаем данные для календаря
-    with get_session() as session:
-        # Задачи с дедлайнами
-        tasks = session.exec(
-            select(Task).where(Task.due.isnot(None))
-        ).all()
-        
-        # Записи обучения
-        learning_logs = session.exec(
-            select(LearningLog)
-        ).all()
+    # Получаем данные для календаря только за отображаемый месяц
+    month_start = date(st.session_state.current_year, st.session_state.current_month, 1)
+    month_end = date(
+        st.session_state.current_year,
+        st.session_state.current_month,
+        calendar.monthrange(st.session_state.current_year, st.session_state.current_month)[1]
+    )
+    # Задачи с дедлайнами и записи обучения
+    tasks, learning_logs = load_calendar_entries(get_data_version(), month_start, month_end)
+    
+    # Раскладываем записи по датам один раз, чтобы каждая ячейка
+    # календаря находила свои данные по ключу, а не перебором списков
+    tasks_by_date = defaultdict(list)
+    for task in tasks:
+        tasks_by_date[task.due].append(task)
+    learning_by_date = defaultdict(list)
+    for log in learning_logs:
+        learning_by_date[log.log_date].append(log)
+    learning_minutes_by_date = {
+        log_date: sum(log.minutes for log in logs)
+        for log_date, logs in learning_by_date.items()
+    }
     
     # Создаем календарь
-    cal = calendar.monthcalendar(st.session_state.current_year, st.session_state.current_month)
+    cal = month_weeks(st.session_state.current_year, st.session_state.current_month)
     
-    # Заголовки дней недели с улучшенным дизайном
+    # Вся сетка месяца собирается в одну HTML-таблицу и выводится
+    # одним вызовом st.markdown вместо десятков отдельных элементов;
+    # оформление задают CSS-классы из APP_STYLES
+    priority_classes = {
+        "Высокий": "chip-high",
+        "Средний": "chip-medium",
+        "Низкий": "chip-low"
+    }
     days = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"]
-    header_cols = st.columns(7)
-    for i, day_name in enumerate(days):
-        with header_cols[i]:
-            st.markdown(f"""
-                <div style='background-color: #f8f9fa; padding: 8px; text-align: center; font-weight: bold; border-radius: 5px; margin: 2px;'>
-                    {day_name}
-                </div>
-            """, unsafe_allow_html=True)
-    
-    # Создаем календарную сетку с улучшенным дизайном
+    calendar_html = ["<table class='cal'><tr>"]
+    for day_name in days:
+        calendar_html.append(f"<th>{day_name}</th>")
+    calendar_html.append("</tr>")
+    
     for week in cal:
-        cols = st.columns(7)
+        calendar_html.append("<tr>")
         for i, day in enumerate(week):
-            with cols[i]:
-                if day == 0:
-                    st.markdown("<div style='height: 80px; margin: 2px;'></div>", unsafe_allow_html=True)
-                else:
-                    current_date = date(st.session_state.current_year, st.session_state.current_month, day)
-                    is_today = current_date == date.today()
-                    is_weekend = i >= 5  # Суббота и воскресенье
-                    
-                    # Стиль для ячейки дня
-                    cell_style = "border: 2px solid #007bff; " if is_today else ""
-                    cell_style += "background-color: #fff3cd; " if is_weekend else "background-color: #ffffff; "
-                    cell_style += "border: 1px solid #dee2e6; padding: 8px; margin: 2px; border-radius: 8px; min-height: 80px;"
-                    
-                    # Заголовок дня
-                    day_style = "color: #dc3545; font-weight: bold; font-size: 16px;" if is_today else "color: #495057; font-weight: bold;"
-                    if is_weekend:
-                        day_style = "color: #6c757d; font-weight: bold;"
-                    
-                    st.markdown(f"""
-                        <div style='{cell_style}'>
-                            <div style='{day_style}; text-align: center; margin-bottom: 5px;'>{day}</div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Показываем задачи на этот день
-                    day_tasks = [t for t in tasks if t.due == current_date]
-                    if day_tasks:
-                        for task in day_tasks:
-                            status = "✅" if task.done else "⏰"
-                            priority_color = {
-                                "Высокий": "#dc3545",
-                                "Средний": "#ffc107", 
-                                "Низкий": "#28a745"
-                            }.get(task.priority, "#28a745")
-                            
-                            st.markdown(f"""
-                                <div style='background-color: {priority_color}; color: white; padding: 3px; margin: 1px; border-radius: 4px; font-size: 9px; text-align: center;'>
-                                    {status} {task.title[:12]}{'...' if len(task.title) > 12 else ''}
-                                </div>
-                            """, unsafe_allow_html=True)
-                    
-                    # Показываем записи обучения на этот день
-                    day_learning = [l for l in learning_logs if l.log_date == current_date]
-                    if day_learning:
-                        total_minutes = sum(l.minutes for l in day_learning)
-                        st.markdown(f"""
-                            <div style='background-color: #6f42c1; color: white; padding: 3px; margin: 1px; border-radius: 4px; font-size: 9px; text-align: center;'>
-                                🐍 {total_minutes}м
-                            </div>
-                        """, unsafe_allow_html=True)
-                    
-                    st.markdown("</div>", unsafe_allow_html=True)
+            if day == 0:
+                calendar_html.append("<td></td>")
+                continue
+            
+            current_date = date(st.session_state.current_year, st.session_state.current_month, day)
+            is_today = current_date == date.today()
+            is_weekend = i >= 5  # Суббота и воскресенье
+            
+            cell_class = "day" + (" today" if is_today else "") + (" weekend" if is_weekend else "")
+            calendar_html.append(f"<td class='{cell_class}'><div class='num'>{day}</div>")
+            
+            # Показываем задачи на этот день
+            for task in tasks_by_date.get(current_date, ()):
+                status = "✅" if task.done else "⏰"
+                chip_class = priority_classes.get(task.priority, "chip-low")
+                short_title = html.escape(task.title[:12]) + ("..." if len(task.title) > 12 else "")
+                calendar_html.append(f"<div class='chip {chip_class}'>{status} {short_title}</div>")
+            
+            # Показываем записи обучения на этот день
+            total_minutes = learning_minutes_by_date.get(current_date)
+            if total_minutes is not None:
+                calendar_html.append(f"<div class='chip chip-learning'>🐍 {total_minutes}м</div>")
+            
+            calendar_html.append("</td>")
+        calendar_html.append("</tr>")
+    calendar_html.append("</table>")
+    
+    st.markdown("".join(calendar_html), unsafe_allow_html=True)
     
     st.divider()
     
@@ -1028,8 +1451,14 @@ with tabs[5]:
     selected_date = st.date_input("Выберите дату", value=date.today())
     
     if selected_date:
+        # Дата вне отображаемого месяца - догружаем записи только за этот день
+        if not month_start <= selected_date <= month_end:
+            tasks_by_date[selected_date], learning_by_date[selected_date] = load_calendar_entries(
+                get_data_version(), selected_date, selected_date
+            )
+        
         # Задачи на выбранную дату
-        day_tasks = [t for t in tasks if t.due == selected_date]
+        day_tasks = tasks_by_date.get(selected_date, ())
         if day_tasks:
             st.write("**Задачи на этот день:**")
             for task in day_tasks:
@@ -1041,7 +1470,7 @@ with tabs[5]:
             st.info("Нет задач на этот день")
         
         # Записи обучения на выбранную дату
-        day_learning = [l for l in learning_logs if l.log_date == selected_date]
+        day_learning = learning_by_date.get(selected_date, ())
         if day_learning:
             st.write("**Обучение в этот день:**")
             total_minutes = 0
@@ -1054,20 +1483,26 @@ with tabs[5]:
         else:
             st.info("Нет записей обучения на этот день")
 
-with tabs[6]:
+with tabs[5]:
+    render_calendar_tab()
+
+@tab_fragment
+def render_notifications_tab():
     """
     ВКЛАДКА УВЕДОМЛЕНИЙ
     Управление всеми уведомлениями
     """
     st.subheader("🔔 Уведомления")
     
-    # Получаем все уведомления (прочитанные и непрочитанные)
-    with get_session() as session:
-        all_notifications = session.exec(
-            select(Notification).order_by(Notification.created_date.desc())
-        ).all()
+    # Счетчики по типу и статусу считает SQLite (GROUP BY), без загрузки строк
+    session = get_request_session()
+    notification_counts = session.exec(
+        select(Notification.type, Notification.is_read, func.count())
+        .group_by(Notification.type, Notification.is_read)
+    ).all()
+    total_notifications = sum(count for _, _, count in notification_counts)
     
-    if all_notifications:
+    if total_notifications:
         # Фильтры
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -1076,27 +1511,45 @@ with tabs[6]:
             show_status = st.selectbox("Статус", ["Все", "Непрочитанные", "Прочитанные"])
         with col3:
             if st.button("🗑️ Очистить все прочитанные"):
-                with get_session() as session:
-                    read_notifications = session.exec(
-                        select(Notification).where(Notification.is_read == True)
-                    ).all()
-                    for notif in read_notifications:
-                        session.delete(notif)
-                    session.commit()
+                session = get_request_session()
+                session.exec(delete(Notification).where(Notification.is_read == True))
+                session.commit()
+                bump_data_version()
                 st.rerun()
         
-        # Фильтруем уведомления
-        filtered_notifications = all_notifications
+        # Фильтруем уведомления в самом запросе (индекс ix_notif_type_unread)
+        statement = select(Notification)
         
         if show_type != "Все":
             type_mapping = {"Дедлайны": "deadline", "Достижения": "achievement", "Мотивация": "motivation"}
-            filtered_notifications = [n for n in filtered_notifications if n.type == type_mapping[show_type]]
+            statement = statement.where(Notification.type == type_mapping[show_type])
         
         if show_status != "Все":
-            if show_status == "Непрочитанные":
-                filtered_notifications = [n for n in filtered_notifications if not n.is_read]
-            else:
-                filtered_notifications = [n for n in filtered_notifications if n.is_read]
+            statement = statement.where(Notification.is_read == (show_status == "Прочитанные"))
+        
+        # Показываем уведомления постранично
+        filtered_count = session.exec(
+            select(func.count()).select_from(statement.subquery())
+        ).one()
+        page_count = max((filtered_count + NOTIFICATIONS_PAGE_SIZE - 1) // NOTIFICATIONS_PAGE_SIZE, 1)
+        page = min(st.session_state.get("notif_page", 0), page_count - 1)
+        st.session_state.notif_page = page
+        filtered_notifications = session.exec(
+            statement.order_by(Notification.created_date.desc())
+            .offset(page * NOTIFICATIONS_PAGE_SIZE)
+            .limit(NOTIFICATIONS_PAGE_SIZE)
+        ).all()
+        
+        if page_count > 1:
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col1:
+                st.button("◀ Назад", key="notif_page_prev", disabled=page == 0,
+                          on_click=shift_page, args=("notif_page", -1))
+            with col2:
+                st.caption(f"Страница {page + 1} из {page_count} · найдено уведомлений: {filtered_count}")
+            with col3:
+                st.button("Следующая страница ▶", key="notif_page_next", disabled=page >= page_count - 1,
+                          on_click=shift_page, args=("notif_page", 1))
         
         # Показываем уведомления
         for notif in filtered_notifications:
@@ -1118,7 +1571,7 @@ with tabs[6]:
                     st.info(f"💪 {notif.message} - {notif.created_date}")
             
             # Кнопки действий
-            col1, col2, col3 = st.columns([1, 1, 8])
+            col1, col2, col3 = st.columns(NOTIFICATION_ACTION_COLUMNS)
             with col1:
                 if not notif.is_read:
                     if st.button("✓ Прочитано", key=f"mark_read_{notif.id}"):
@@ -1126,21 +1579,16 @@ with tabs[6]:
                         st.rerun()
                 else:
                     if st.button("↩️ Непрочитано", key=f"mark_unread_{notif.id}"):
-                        with get_session() as session:
-                            notification = session.get(Notification, notif.id)
-                            if notification:
-                                notification.is_read = False
-                                session.add(notification)
-                                session.commit()
+                        mark_notification_unread(notif.id)
                         st.rerun()
             
             with col2:
                 if st.button("🗑️ Удалить", key=f"delete_{notif.id}"):
-                    with get_session() as session:
-                        notification = session.get(Notification, notif.id)
-                        if notification:
-                            session.delete(notification)
-                            session.commit()
+                    session = get_request_session()
+                    session.exec(delete(Notification).where(Notification.id == notif.id))
+                    session.commit()
+                    bump_data_version()
+                    get_unread_notifications.clear()
                     st.rerun()
             
             st.divider()
@@ -1150,19 +1598,18 @@ with tabs[6]:
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_notifications = len(all_notifications)
             st.metric("Всего уведомлений", total_notifications)
         
         with col2:
-            unread_count = len([n for n in all_notifications if not n.is_read])
+            unread_count = sum(count for _, is_read, count in notification_counts if not is_read)
             st.metric("Непрочитанных", unread_count)
         
         with col3:
-            deadline_count = len([n for n in all_notifications if n.type == "deadline"])
+            deadline_count = sum(count for notif_type, _, count in notification_counts if notif_type == "deadline")
             st.metric("Дедлайны", deadline_count)
         
         with col4:
-            achievement_count = len([n for n in all_notifications if n.type == "achievement"])
+            achievement_count = sum(count for notif_type, _, count in notification_counts if notif_type == "achievement")
             st.metric("Достижения", achievement_count)
     
     else:
@@ -1172,4 +1619,10 @@ with tabs[6]:
         st.subheader("💡 Как получить уведомления:")
         st.write("• **Дедлайны**: Добавьте задачи с датами выполнения")
         st.write("• **Достижения**: Выполните 3+ задач в день или завершите книгу")
-        st.write("• **Мотивация**: Изучайте Python 60+ минут в день")
\ No newline at end of file
+        st.write("• **Мотивация**: Изучайте Python 60+ минут в день")
+
+with tabs[6]:
+    render_notifications_tab()
+
+# Запуск скрипта завершен - возвращаем соединение в пул
+close_request_session()
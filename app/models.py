@@ -10,34 +10,43 @@ from __future__ import annotations
 
 import datetime as dt
 from typing import Optional
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, Index, text
 
 
-class Task(SQLModel, table=True, extend_existing=True):
+class Task(SQLModel, table=True):
     """
     Модель задачи
     
     Параметры:
     - table=True: создает таблицу в базе данных
-    - extend_existing=True: позволяет переопределять существующую таблицу (для миграций)
     
     Поля:
     - id: уникальный идентификатор (первичный ключ)
     - title: название задачи (с индексом для быстрого поиска)
     - priority: приоритет задачи
-    - due: дата выполнения (может быть пустой)
+    - due: дата выполнения (может быть пустой, с индексом)
     - desc: описание задачи
-    - done: выполнена ли задача (булево значение)
+    - done: выполнена ли задача (булево значение, первый столбец составных индексов)
+    
+    Составной индекс (done, due) ускоряет поиск невыполненных задач
+    с приближающимся дедлайном: равенство по done, затем диапазон по due.
+    Индекс (done, due IS NULL, due) повторяет сортировку списка задач,
+    поэтому страница списка читается по индексу без сортировки всей таблицы.
     """
+    __table_args__ = (
+        Index("ix_task_done_due", "done", "due"),
+        Index("ix_task_list_order", "done", text("due IS NULL"), "due"),
+    )
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(index=True)  # index=True создает индекс для быстрого поиска
     priority: str = Field(default="Средний")
-    due: Optional[dt.date] = Field(default=None)
+    due: Optional[dt.date] = Field(default=None, index=True)
     desc: str = Field(default="")
     done: bool = Field(default=False)
 
 
-class Show(SQLModel, table=True, extend_existing=True):
+class Show(SQLModel, table=True):
     """
     Модель сериала
     
@@ -54,7 +63,7 @@ class Show(SQLModel, table=True, extend_existing=True):
     total_watched_episodes: int = Field(default=0)  # Общее количество просмотренных серий
 
 
-class Book(SQLModel, table=True, extend_existing=True):
+class Book(SQLModel, table=True):
     """
     Модель книги
     
@@ -69,7 +78,7 @@ class Book(SQLModel, table=True, extend_existing=True):
     pages_read: int = Field(default=0)  # Прочитано страниц
 
 
-class LearningLog(SQLModel, table=True, extend_existing=True):
+class LearningLog(SQLModel, table=True):
     """
     Модель записи обучения
     
@@ -83,10 +92,10 @@ class LearningLog(SQLModel, table=True, extend_existing=True):
     topic: str = Field(index=True)
     minutes: int = Field(default=0)
     notes: str = Field(default="")
-    log_date: dt.date = Field(default_factory=dt.date.today)  # По умолчанию сегодняшняя дата
+    log_date: dt.date = Field(default_factory=dt.date.today, index=True)  # По умолчанию сегодняшняя дата
 
 
-class Notification(SQLModel, table=True, extend_existing=True):
+class Notification(SQLModel, table=True):
     """
     Модель уведомления
     
@@ -94,11 +103,20 @@ class Notification(SQLModel, table=True, extend_existing=True):
     - Напоминаний о дедлайнах
     - Достижений
     - Мотивационных сообщений
+    
+    Составной индекс (is_read, created_date) позволяет выбирать непрочитанные
+    уведомления сразу в порядке даты, без отдельной сортировки, а индекс
+    (type, is_read, created_date) обслуживает фильтры вкладки уведомлений.
     """
+    __table_args__ = (
+        Index("ix_notif_unread", "is_read", "created_date"),
+        Index("ix_notif_type_unread", "type", "is_read", "created_date"),
+    )
+    
     id: Optional[int] = Field(default=None, primary_key=True)
-    type: str = Field(index=True)  # Тип уведомления: "deadline", "achievement", "motivation"
+    type: str  # Тип уведомления: "deadline", "achievement", "motivation"
     title: str = Field(index=True)
     message: str = Field(default="")
     is_read: bool = Field(default=False)  # Прочитано ли уведомление
-    created_date: dt.date = Field(default_factory=dt.date.today)
-    related_id: Optional[int] = Field(default=None)  # ID связанного объекта (задача, книга и т.д.)
\ No newline at end of file
+    created_date: dt.date = Field(default_factory=dt.date.today, index=True)
+    related_id: Optional[int] = Field(default=None, index=True)  # ID связанного объекта (задача, книга и т.д.)
\ No newline at end of file
@@ -7,16 +7,11 @@ import subprocess
 import sys
 import os
 
-def main():
-    """Запуск Streamlit приложения"""
+def run_in_subprocess(cmd, app_dir):
+    """Запуск Streamlit дочерним процессом с ожиданием его завершения"""
     try:
-        # Переходим в директорию с приложением
-        app_dir = os.path.join(os.path.dirname(__file__), 'app')
-        
-        # Запускаем Streamlit
-        cmd = [sys.executable, '-m', 'streamlit', 'run', 'main.py']
         subprocess.run(cmd, cwd=app_dir, check=True)
-        
+
     except subprocess.CalledProcessError as e:
         print(f"Ошибка при запуске приложения: {e}")
         sys.exit(1)
@@ -24,5 +19,27 @@ def main():
         print("\nПриложение остановлено пользователем")
         sys.exit(0)
 
+def main():
+    """Запуск Streamlit приложения"""
+    # Переходим в директорию с приложением
+    app_dir = os.path.join(os.path.dirname(__file__), 'app')
+    cmd = [sys.executable, '-m', 'streamlit', 'run', 'main.py']
+
+    # В Windows exec не заменяет текущий процесс, а запускает новый и сразу
+    # завершает старый, отрывая Streamlit от консоли - там остаемся на subprocess
+    if os.name == "nt":
+        run_in_subprocess(cmd, app_dir)
+        return
+
+    try:
+        # Streamlit заменяет этот процесс: лишний интерпретатор не висит
+        # в памяти, а Ctrl+C и другие сигналы Streamlit получает напрямую
+        os.chdir(app_dir)
+        os.execvp(cmd[0], cmd)
+
+    except FileNotFoundError as e:
+        print(f"Ошибка при запуске приложения: {e}")
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()